@@ -9,20 +9,67 @@ from .models import (
     Vaccine,
     Reminder,
     VaccinationCenter,
+    VaccineOption,
     News
 )
 
 
+# =====================================================
+# PRE-RENDERED BADGES
+# =====================================================
+# Badge columns only ever show a handful of distinct values, so render
+# each one once at import instead of calling format_html for every row.
+
+def _badge(color, label):
+    return format_html('<span style="color: {}; font-weight: bold;">{}</span>', color, label)
+
+
+_VACCINE_STATUS_BADGES = {
+    status: _badge(color, status)
+    for status, color in [
+        ('Scheduled', 'blue'),
+        ('Completed', 'green'),
+        ('Overdue', 'red'),
+        ('Cancelled', 'gray'),
+    ]
+}
+
+_REMINDER_STATUS_BADGES = {
+    status: _badge(color, status)
+    for status, color in [
+        ('Active', 'green'),
+        ('Completed', 'blue'),
+        ('Missed', 'red'),
+    ]
+}
+
+_PUBLISHED_BADGES = {
+    True: _badge('green', '✓ Published'),
+    False: _badge('orange', '✎ Draft'),
+}
+
+_FEATURED_BADGES = {
+    True: _badge('gold', '★ Featured'),
+    False: '-',
+}
+
+_ACTIVE_BADGES = {
+    True: _badge('green', '✓ Active'),
+    False: _badge('red', '✗ Inactive'),
+}
+
+
 # =====================================================
 # UPDATE ADMIN
 # =====================================================
 @admin.register(Update)
 class UpdateAdmin(admin.ModelAdmin):
     list_display = ['title', 'posted_by', 'created_at']
-    list_filter = ['created_at', 'posted_by']
+    list_filter = ['posted_by']
     search_fields = ['title', 'description']
     date_hierarchy = 'created_at'
     readonly_fields = ['created_at']
+    list_select_related = ['posted_by']
 
     fieldsets = (
         ('Update Information', {
@@ -44,6 +91,7 @@ class ProfileAdmin(admin.ModelAdmin):
     list_filter = ['gender', 'blood_group']
     search_fields = ['user__username', 'user__email', 'user__first_name', 'mobile']
     readonly_fields = ['user']
+    list_select_related = ['user']
 
     fieldsets = (
         ('User Account', {
@@ -94,8 +142,14 @@ class FamilyMemberAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user').annotate(
+            _vaccine_count=Count('vaccines')
+        )
+
     def vaccine_count(self, obj):
-        count = obj.vaccines.count()
+        # Annotated in get_queryset; unsaved instances (add form) have none yet
+        count = getattr(obj, '_vaccine_count', 0)
         if count > 0:
             return format_html(
                 '<span style="color: green; font-weight: bold;">{} vaccines</span>',
@@ -104,6 +158,7 @@ class FamilyMemberAdmin(admin.ModelAdmin):
         return format_html('<span style="color: gray;">No vaccines</span>')
 
     vaccine_count.short_description = 'Vaccines'
+    vaccine_count.admin_order_field = '_vaccine_count'
 
 
 # =====================================================
@@ -119,7 +174,7 @@ class VaccineAdmin(admin.ModelAdmin):
         'status_badge',
         'user'
     ]
-    list_filter = ['name', 'status', 'dose_number', 'date_administered']
+    list_filter = ['name', 'status', 'dose_number']
     search_fields = [
         'name',
         'user__username',
@@ -129,6 +184,7 @@ class VaccineAdmin(admin.ModelAdmin):
     ]
     date_hierarchy = 'date_administered'
     readonly_fields = ['created_at', 'updated_at']
+    list_select_related = ['user', 'family_member']
 
     fieldsets = (
         ('Vaccine Information', {
@@ -156,18 +212,8 @@ class VaccineAdmin(admin.ModelAdmin):
     get_recipient.short_description = 'Recipient'
 
     def status_badge(self, obj):
-        colors = {
-            'Scheduled': 'blue',
-            'Completed': 'green',
-            'Overdue': 'red',
-            'Cancelled': 'gray',
-        }
-        color = colors.get(obj.status, 'black')
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
-            obj.status
-        )
+        badge = _VACCINE_STATUS_BADGES.get(obj.status)
+        return badge if badge is not None else _badge('black', obj.status)
 
     status_badge.short_description = 'Status'
 
@@ -185,10 +231,11 @@ class ReminderAdmin(admin.ModelAdmin):
         'status_badge',
         'completed'
     ]
-    list_filter = ['completed', 'scheduled_datetime']
-    search_fields = ['vaccine_name', 'family_member', 'user__username']
+    list_filter = ['completed']
+    search_fields = ['vaccine_name', 'family_member__name', 'user__username']
     date_hierarchy = 'scheduled_datetime'
     readonly_fields = ['created_at', 'updated_at', 'status']
+    list_select_related = ['user', 'family_member']
 
     fieldsets = (
         ('Reminder Information', {
@@ -205,17 +252,8 @@ class ReminderAdmin(admin.ModelAdmin):
 
     def status_badge(self, obj):
         status = obj.status
-        colors = {
-            'Active': 'green',
-            'Completed': 'blue',
-            'Missed': 'red',
-        }
-        color = colors.get(status, 'black')
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
-            status
-        )
+        badge = _REMINDER_STATUS_BADGES.get(status)
+        return badge if badge is not None else _badge('black', status)
 
     status_badge.short_description = 'Status'
 
@@ -232,10 +270,12 @@ class VaccinationCenterAdmin(admin.ModelAdmin):
         'active_status',
         'created_at'
     ]
-    list_filter = ['city', 'is_active', 'created_at']
-    search_fields = ['name', 'address', 'available_vaccines', 'phone', 'email']
+    list_filter = ['city', 'is_active']
+    search_fields = ['name', 'address', 'vaccines__name', 'phone', 'email']
+    filter_horizontal = ['vaccines']
     readonly_fields = ['created_at', 'updated_at']
     date_hierarchy = 'created_at'
+    list_select_related = ['created_by']
 
     fieldsets = (
         ('Center Information', {
@@ -248,7 +288,7 @@ class VaccinationCenterAdmin(admin.ModelAdmin):
             'fields': ('opening_time', 'closing_time')
         }),
         ('Services', {
-            'fields': ('available_vaccines', 'description')
+            'fields': ('vaccines', 'description')
         }),
         ('Location Coordinates', {
             'fields': ('latitude', 'longitude'),
@@ -261,20 +301,29 @@ class VaccinationCenterAdmin(admin.ModelAdmin):
     )
 
     def active_status(self, obj):
-        if obj.is_active:
-            return format_html(
-                '<span style="color: green; font-weight: bold;">✓ Active</span>'
-            )
-        return format_html(
-            '<span style="color: red; font-weight: bold;">✗ Inactive</span>'
-        )
+        return _ACTIVE_BADGES[bool(obj.is_active)]
 
     active_status.short_description = 'Status'
 
     def save_model(self, request, obj, form, change):
         if not change:  # If creating new object
             obj.created_by = request.user
-        super().save_model(request, obj, form, change)
+        if change and form.changed_data:
+            # Only rewrite the edited columns (plus the auto_now timestamp);
+            # many-to-many changes are saved separately by save_related
+            changed = [f for f in form.changed_data if f != 'vaccines']
+            obj.save(update_fields=[*changed, 'updated_at'])
+        else:
+            super().save_model(request, obj, form, change)
+
+
+# =====================================================
+# VACCINE OPTION ADMIN
+# =====================================================
+@admin.register(VaccineOption)
+class VaccineOptionAdmin(admin.ModelAdmin):
+    list_display = ['name']
+    search_fields = ['name']
 
 
 # =====================================================
@@ -290,11 +339,12 @@ class NewsAdmin(admin.ModelAdmin):
         'views',
         'published_date'
     ]
-    list_filter = ['category', 'is_published', 'is_featured', 'published_date']
+    list_filter = ['category', 'is_published', 'is_featured']
     search_fields = ['title', 'content', 'summary', 'source']
     prepopulated_fields = {'slug': ('title',)}
     readonly_fields = ['views', 'created_at', 'updated_at', 'get_reading_time']
     date_hierarchy = 'published_date'
+    list_select_related = ['author']
 
     fieldsets = (
         ('Article Information', {
@@ -320,23 +370,24 @@ class NewsAdmin(admin.ModelAdmin):
         }),
     )
 
-    def published_status(self, obj):
-        if obj.is_published:
-            return format_html(
-                '<span style="color: green; font-weight: bold;">✓ Published</span>'
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name and match.url_name.endswith('_changelist'):
+            # The list never shows content/summary/image, so don't fetch them
+            qs = qs.only(
+                'id', 'title', 'slug', 'category', 'is_published', 'is_featured',
+                'views', 'published_date', 'author'
             )
-        return format_html(
-            '<span style="color: orange; font-weight: bold;">✎ Draft</span>'
-        )
+        return qs
+
+    def published_status(self, obj):
+        return _PUBLISHED_BADGES[bool(obj.is_published)]
 
     published_status.short_description = 'Status'
 
     def featured_badge(self, obj):
-        if obj.is_featured:
-            return format_html(
-                '<span style="color: gold; font-weight: bold;">★ Featured</span>'
-            )
-        return '-'
+        return _FEATURED_BADGES[bool(obj.is_featured)]
 
     featured_badge.short_description = 'Featured'
 
@@ -348,7 +399,11 @@ class NewsAdmin(admin.ModelAdmin):
     def save_model(self, request, obj, form, change):
         if not change:  # If creating new object
             obj.author = request.user
-        super().save_model(request, obj, form, change)
+        if change and form.changed_data:
+            # Only rewrite the edited columns (plus the auto_now timestamp)
+            obj.save(update_fields=[*form.changed_data, 'updated_at'])
+        else:
+            super().save_model(request, obj, form, change)
 
 
 # =====================================================
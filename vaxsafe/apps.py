@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class VaxsafeConfig(AppConfig):
     name = 'vaxsafe'
+
+    def ready(self):
+        from . import signals  # noqa: F401 - registers receivers
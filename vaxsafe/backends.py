@@ -0,0 +1,15 @@
+# backends.py - Authentication backend for VaxSafe
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+
+class ProfileModelBackend(ModelBackend):
+    """ModelBackend that loads the user's profile in the same query"""
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.select_related('profile').get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -1,10 +1,21 @@
 # forms.py - Complete and Optimized (No changes required for Centers and News)
 # The existing forms.py remains the same as provided
 from django import forms
-from .models import Profile, FamilyMember, Vaccine, Reminder
+from .models import Profile, FamilyMember, Vaccine, Reminder, VALID_BLOOD_GROUPS
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 
+# Separators allowed in mobile numbers, stripped before the digit check
+_MOBILE_STRIP = str.maketrans('', '', ' -()+')
+
+
+def _shift_years(day, years):
+    """Return the same calendar day `years` away (Feb 29 falls back to Feb 28)"""
+    try:
+        return day.replace(year=day.year + years)
+    except ValueError:
+        return day.replace(year=day.year + years, day=28)
+
 
 class ProfileForm(forms.ModelForm):
     """
@@ -27,7 +38,6 @@ class ProfileForm(forms.ModelForm):
             'date_of_birth': forms.DateInput(attrs={
                 'class': 'form-control',
                 'type': 'date',
-                'max': timezone.now().date().isoformat()
             }),
             'profession': forms.TextInput(attrs={
                 'class': 'form-control',
@@ -66,12 +76,17 @@ class ProfileForm(forms.ModelForm):
             'photo': 'Upload a profile picture (optional)'
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Set per instance; a class-level value would be frozen at import time
+        self.fields['date_of_birth'].widget.attrs['max'] = timezone.localdate().isoformat()
+
     def clean_mobile(self):
         """Validate mobile number"""
         mobile = self.cleaned_data.get('mobile')
         if mobile:
             # Remove spaces and special characters for validation
-            cleaned = mobile.replace(' ', '').replace('-', '').replace('(', '').replace(')', '').replace('+', '')
+            cleaned = mobile.translate(_MOBILE_STRIP)
             if not cleaned.isdigit():
                 raise ValidationError('Mobile number should contain only digits and optional +, -, (, ) characters')
             if len(cleaned) < 10:
@@ -82,8 +97,7 @@ class ProfileForm(forms.ModelForm):
         """Validate blood group format"""
         blood_group = self.cleaned_data.get('blood_group')
         if blood_group:
-            valid_groups = ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
-            if blood_group.upper() not in valid_groups:
+            if blood_group.upper() not in VALID_BLOOD_GROUPS:
                 raise ValidationError('Please enter a valid blood group (A+, A-, B+, B-, AB+, AB-, O+, O-)')
             return blood_group.upper()
         return blood_group
@@ -123,7 +137,6 @@ class FamilyMemberForm(forms.ModelForm):
             'date_of_birth': forms.DateInput(attrs={
                 'class': 'form-control',
                 'type': 'date',
-                'max': timezone.now().date().isoformat()
             }),
             'gender': forms.Select(attrs={
                 'class': 'form-control'
@@ -172,13 +185,8 @@ class FamilyMemberForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super(FamilyMemberForm, self).__init__(*args, **kwargs)
-        # Make fields optional
-        optional_fields = [
-            'age', 'date_of_birth', 'gender', 'blood_group',
-            'vaccine_name', 'date_time', 'notification_type'
-        ]
-        for field in optional_fields:
-            self.fields[field].required = False
+        # Optional fields are blank=True on the model, so they are already not required
+        self.fields['date_of_birth'].widget.attrs['max'] = timezone.localdate().isoformat()
 
     def clean(self):
         """Cross-field validation"""
@@ -196,8 +204,7 @@ class FamilyMemberForm(forms.ModelForm):
         """Validate blood group"""
         blood_group = self.cleaned_data.get('blood_group')
         if blood_group:
-            valid_groups = ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
-            if blood_group.upper() not in valid_groups:
+            if blood_group.upper() not in VALID_BLOOD_GROUPS:
                 raise ValidationError('Please enter a valid blood group')
             return blood_group.upper()
         return blood_group
@@ -302,23 +309,18 @@ class VaccineForm(forms.ModelForm):
         """Initialize form with user-specific family members"""
         self.user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
+        self._today = timezone.localdate()
+        self._min_date = _shift_years(self._today, -100)
+        self._max_date = _shift_years(self._today, 5)
 
         # Filter family members by current user
         if self.user:
+            # Option labels use __str__ (name + relation); skip the other columns
             self.fields['family_member'].queryset = FamilyMember.objects.filter(
                 user=self.user
-            ).order_by('name')
+            ).only('id', 'name', 'relation').order_by('name')
             self.fields['family_member'].empty_label = "Self (Me)"
 
-        # Make certain fields optional
-        optional_fields = [
-            'family_member', 'manufacturer', 'batch_number',
-            'next_dose_date', 'location', 'healthcare_provider',
-            'notes', 'side_effects'
-        ]
-        for field in optional_fields:
-            self.fields[field].required = False
-
         # Set default status for new records
         if not self.instance.pk:
             self.fields['status'].initial = 'Scheduled'
@@ -328,18 +330,14 @@ class VaccineForm(forms.ModelForm):
         date_administered = self.cleaned_data.get('date_administered')
 
         if date_administered:
-            today = timezone.now().date()
-            years_ago = (today - date_administered).days / 365
-
-            # Check if date is too far in the past
-            if years_ago > 100:
+            # Check if date is too far in the past (more than 100 years)
+            if date_administered < self._min_date:
                 raise ValidationError(
                     'The date seems too far in the past. Please check the date.'
                 )
 
             # Check if date is too far in the future (more than 5 years)
-            years_future = (date_administered - today).days / 365
-            if years_future > 5:
+            if date_administered > self._max_date:
                 raise ValidationError(
                     'The date seems too far in the future. Please check the date.'
                 )
@@ -368,7 +366,7 @@ class VaccineForm(forms.ModelForm):
 
         # Auto-update status based on date
         if date_administered:
-            today = timezone.now().date()
+            today = self._today
 
             # If date is in the past and status is scheduled, suggest overdue
             if date_administered < today and status == 'Scheduled':
@@ -397,10 +395,8 @@ class ReminderForm(forms.ModelForm):
                 'type': 'datetime-local',
                 'required': True
             }),
-            'family_member': forms.TextInput(attrs={
+            'family_member': forms.Select(attrs={
                 'class': 'form-control',
-                'placeholder': 'Family member name',
-                'required': True
             }),
         }
 
@@ -413,9 +409,20 @@ class ReminderForm(forms.ModelForm):
         help_texts = {
             'vaccine_name': 'Name of the vaccine',
             'scheduled_datetime': 'When should we remind you?',
-            'family_member': 'Who is this reminder for?'
+            'family_member': 'Who is this reminder for? Leave blank for yourself'
         }
 
+    def __init__(self, *args, **kwargs):
+        """Initialize form with user-specific family members"""
+        self.user = kwargs.pop('user', None)
+        super().__init__(*args, **kwargs)
+
+        if self.user:
+            self.fields['family_member'].queryset = FamilyMember.objects.filter(
+                user=self.user
+            ).only('id', 'name', 'relation').order_by('name')
+            self.fields['family_member'].empty_label = "Self (Me)"
+
     def clean_scheduled_datetime(self):
         """Validate that reminder is not in the past"""
         scheduled = self.cleaned_data.get('scheduled_datetime')
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from vaxsafe.models import Vaccine
+
+
+class Command(BaseCommand):
+    help = "Mark scheduled vaccines whose date has passed as Overdue (run daily from cron)"
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+
+        # One set-based UPDATE; no rows are loaded into Python
+        updated = Vaccine.objects.filter(
+            status='Scheduled',
+            date_administered__lt=today
+        ).update(status='Overdue')
+
+        self.stdout.write(self.style.SUCCESS(f"Marked {updated} vaccine(s) as overdue."))
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:05
+
+from django.db import migrations, models
+
+
+def backfill_reading_time(apps, schema_editor):
+    News = apps.get_model('vaxsafe', 'News')
+    articles = list(News.objects.only('id', 'content'))
+    for article in articles:
+        article.reading_time_minutes = max(1, len(article.content.split()) // 200)
+    News.objects.bulk_update(articles, ['reading_time_minutes'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaxsafe', '0003_news_vaccinationcenter_alter_reminder_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='news',
+            name='reading_time_minutes',
+            field=models.PositiveIntegerField(default=1, editable=False, help_text='Estimated reading time, computed from content on save'),
+        ),
+        migrations.RunPython(backfill_reading_time, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaxsafe', '0005_news_reading_time_minutes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='familymember',
+            constraint=models.CheckConstraint(condition=models.Q(('blood_group__in', ['A+', 'A-', 'AB+', 'AB-', 'B+', 'B-', 'O+', 'O-']), ('blood_group', ''), ('blood_group__isnull', True), _connector='OR'), name='familymember_valid_blood_group'),
+        ),
+        migrations.AddConstraint(
+            model_name='profile',
+            constraint=models.CheckConstraint(condition=models.Q(('blood_group__in', ['A+', 'A-', 'AB+', 'AB-', 'B+', 'B-', 'O+', 'O-']), ('blood_group', ''), ('blood_group__isnull', True), _connector='OR'), name='profile_valid_blood_group'),
+        ),
+    ]
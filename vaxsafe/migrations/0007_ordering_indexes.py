@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaxsafe', '0006_blood_group_constraints'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reminder',
+            index=models.Index(fields=['-scheduled_datetime'], name='vaxsafe_rem_schedul_0b3e3f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='update',
+            index=models.Index(fields=['-created_at'], name='vaxsafe_upd_created_da9de9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaccinationcenter',
+            index=models.Index(fields=['city', 'name'], name='vaxsafe_vac_city_b29a8b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaccine',
+            index=models.Index(fields=['-date_administered'], name='vaxsafe_vac_date_ad_ffa8b9_idx'),
+        ),
+    ]
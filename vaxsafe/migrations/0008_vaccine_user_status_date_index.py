@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaxsafe', '0007_ordering_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vaccine',
+            index=models.Index(fields=['user', 'status', 'date_administered'], name='vaxsafe_vac_user_id_952cab_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:08
+
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaxsafe', '0008_vaccine_user_status_date_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='vaccine',
+            name='vaxsafe_vac_status_1ac528_idx',
+        ),
+    ]
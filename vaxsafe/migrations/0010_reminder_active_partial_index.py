@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaxsafe', '0009_remove_vaccine_status_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='reminder',
+            name='vaxsafe_rem_complet_14fa1c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='reminder',
+            index=models.Index(condition=models.Q(('completed', False)), fields=['user', 'scheduled_datetime'], name='rem_active_user_dt'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    auth.User.email is not indexed by Django. Registration looks accounts up
+    by email, so add the index from here since the auth app is not ours.
+    """
+
+    dependencies = [
+        ('vaxsafe', '0010_reminder_active_partial_index'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE INDEX IF NOT EXISTS vaxsafe_user_email_idx ON auth_user (email);',
+            reverse_sql='DROP INDEX IF EXISTS vaxsafe_user_email_idx;',
+        ),
+    ]
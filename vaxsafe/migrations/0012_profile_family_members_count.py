@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:11
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_family_members_count(apps, schema_editor):
+    Profile = apps.get_model('vaxsafe', 'Profile')
+    FamilyMember = apps.get_model('vaxsafe', 'FamilyMember')
+    counts = FamilyMember.objects.values('user_id').annotate(n=Count('id'))
+    for row in counts:
+        Profile.objects.filter(user_id=row['user_id']).update(family_members_count=row['n'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaxsafe', '0011_auth_user_email_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='family_members_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of family members, kept in sync by signals'),
+        ),
+        migrations.RunPython(backfill_family_members_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:13
+
+from collections import Counter
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F
+
+
+def link_family_members(apps, schema_editor):
+    """
+    Point each reminder at the user's family member with the stored name.
+    Names with no matching member get a new member (relation "Other") so
+    they don't silently become reminders for the user themselves.
+    """
+    Reminder = apps.get_model('vaxsafe', 'Reminder')
+    FamilyMember = apps.get_model('vaxsafe', 'FamilyMember')
+    Profile = apps.get_model('vaxsafe', 'Profile')
+
+    members = {}
+    for member in FamilyMember.objects.order_by('-id').only('id', 'user_id', 'name'):
+        # Lowest id wins when a user has two members with the same name
+        members[(member.user_id, member.name.strip().lower())] = member.id
+
+    created = Counter()
+    reminders = list(Reminder.objects.only('id', 'user_id', 'family_member'))
+    for reminder in reminders:
+        name = (reminder.family_member or '').strip()
+        if not name:
+            continue
+        key = (reminder.user_id, name.lower())
+        if key not in members:
+            members[key] = FamilyMember.objects.create(
+                user_id=reminder.user_id, name=name[:100], relation='Other'
+            ).id
+            created[reminder.user_id] += 1
+        reminder.family_member_fk_id = members[key]
+    Reminder.objects.bulk_update(reminders, ['family_member_fk'], batch_size=500)
+
+    # Historical models don't fire the signals that keep the counter in sync
+    for user_id, n in created.items():
+        Profile.objects.filter(user_id=user_id).update(family_members_count=F('family_members_count') + n)
+
+
+def unlink_family_members(apps, schema_editor):
+    Reminder = apps.get_model('vaxsafe', 'Reminder')
+    reminders = list(Reminder.objects.select_related('family_member_fk'))
+    for reminder in reminders:
+        reminder.family_member = reminder.family_member_fk.name if reminder.family_member_fk else ''
+    Reminder.objects.bulk_update(reminders, ['family_member'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaxsafe', '0012_profile_family_members_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reminder',
+            name='family_member_fk',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='vaxsafe.familymember'),
+        ),
+        migrations.RunPython(link_family_members, unlink_family_members),
+        # Give the old column a default so the removal can be reversed
+        migrations.AlterField(
+            model_name='reminder',
+            name='family_member',
+            field=models.CharField(default='', help_text='Family member name', max_length=255),
+        ),
+        migrations.RemoveField(
+            model_name='reminder',
+            name='family_member',
+        ),
+        migrations.RenameField(
+            model_name='reminder',
+            old_name='family_member_fk',
+            new_name='family_member',
+        ),
+        migrations.AlterField(
+            model_name='reminder',
+            name='family_member',
+            field=models.ForeignKey(blank=True, help_text='Family member this reminder is for (blank for yourself)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to='vaxsafe.familymember'),
+        ),
+    ]
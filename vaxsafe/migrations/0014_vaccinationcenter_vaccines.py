@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:15
+
+from django.db import migrations, models
+
+
+def split_available_vaccines(apps, schema_editor):
+    """Turn each center's comma-separated vaccine list into VaccineOption rows"""
+    VaccinationCenter = apps.get_model('vaxsafe', 'VaccinationCenter')
+    VaccineOption = apps.get_model('vaxsafe', 'VaccineOption')
+    Through = VaccinationCenter.vaccines.through
+
+    names_by_center = {}
+    for center in VaccinationCenter.objects.exclude(available_vaccines__isnull=True).only('id', 'available_vaccines'):
+        names = {v.strip()[:100] for v in center.available_vaccines.split(',') if v.strip()}
+        if names:
+            names_by_center[center.id] = names
+
+    all_names = set().union(*names_by_center.values())
+    VaccineOption.objects.bulk_create(
+        [VaccineOption(name=name) for name in sorted(all_names)],
+        ignore_conflicts=True,
+    )
+    option_ids = dict(VaccineOption.objects.filter(name__in=all_names).values_list('name', 'id'))
+
+    Through.objects.bulk_create(
+        [
+            Through(vaccinationcenter_id=center_id, vaccineoption_id=option_ids[name])
+            for center_id, names in names_by_center.items()
+            for name in names
+        ],
+        batch_size=500,
+    )
+
+
+def join_available_vaccines(apps, schema_editor):
+    VaccinationCenter = apps.get_model('vaxsafe', 'VaccinationCenter')
+    centers = list(VaccinationCenter.objects.prefetch_related('vaccines'))
+    for center in centers:
+        names = [v.name for v in center.vaccines.all()]
+        center.available_vaccines = ', '.join(sorted(names)) or None
+    VaccinationCenter.objects.bulk_update(centers, ['available_vaccines'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaxsafe', '0013_reminder_family_member_fk'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VaccineOption',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Vaccine name', max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Vaccine Option',
+                'verbose_name_plural': 'Vaccine Options',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='vaccinationcenter',
+            name='vaccines',
+            field=models.ManyToManyField(blank=True, help_text='Vaccines available at this center', related_name='centers', to='vaxsafe.vaccineoption'),
+        ),
+        migrations.RunPython(split_available_vaccines, join_available_vaccines),
+        migrations.RemoveField(
+            model_name='vaccinationcenter',
+            name='available_vaccines',
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaxsafe', '0014_vaccinationcenter_vaccines'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(condition=models.Q(('is_featured', True), ('is_published', True)), fields=['-published_date'], name='news_featured_idx'),
+        ),
+    ]
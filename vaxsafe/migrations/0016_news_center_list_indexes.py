@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-15 15:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vaxsafe', '0015_news_featured_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='news',
+            name='vaxsafe_new_publish_fa6190_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='vaccinationcenter',
+            name='vaxsafe_vac_city_1712d2_idx',
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['is_published', '-published_date'], name='vaxsafe_new_is_publ_ad393c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vaccinationcenter',
+            index=models.Index(fields=['is_active', 'city', 'name'], name='vaxsafe_vac_is_acti_532c42_idx'),
+        ),
+    ]
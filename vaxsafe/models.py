@@ -1,8 +1,27 @@
 # models.py - Complete and Optimized with Centers and News
 from django.db import models
+from django.db.models import F
 from django.contrib.auth.models import User
 from django.conf import settings
 from django.utils import timezone
+from django.utils.text import slugify
+
+VALID_BLOOD_GROUPS = frozenset({'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'})
+
+# Blood group is optional, so empty and NULL are allowed alongside the valid values
+_VALID_BLOOD_GROUP_Q = (
+    models.Q(blood_group__in=sorted(VALID_BLOOD_GROUPS)) |
+    models.Q(blood_group='') |
+    models.Q(blood_group__isnull=True)
+)
+
+
+class UserScopedManager(models.Manager):
+    """Manager for records owned by a single user"""
+
+    def for_user(self, user):
+        """Only the given user's rows"""
+        return self.filter(user=user)
 
 
 class Update(models.Model):
@@ -18,6 +37,9 @@ class Update(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Update'
         verbose_name_plural = 'Updates'
+        indexes = [
+            models.Index(fields=['-created_at']),
+        ]
 
     def __str__(self):
         return self.title
@@ -41,10 +63,29 @@ class Profile(models.Model):
     address = models.TextField(blank=True, null=True)
     blood_group = models.CharField(max_length=5, blank=True, null=True)
     photo = models.ImageField(upload_to='profile_pics/', blank=True, null=True)
+    family_members_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of family members, kept in sync by signals"
+    )
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(condition=_VALID_BLOOD_GROUP_Q, name='profile_valid_blood_group'),
+        ]
 
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
+    def save(self, *args, **kwargs):
+        """Leave family_members_count to the signals when updating an existing row"""
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name != 'family_members_count'
+            ]
+        super().save(*args, **kwargs)
+
     def get_full_name(self):
         """Get user's full name"""
         return self.user.get_full_name() or self.user.username
@@ -96,6 +137,8 @@ class FamilyMember(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UserScopedManager()
+
     class Meta:
         ordering = ['name']
         verbose_name = 'Family Member'
@@ -103,19 +146,20 @@ class FamilyMember(models.Model):
         indexes = [
             models.Index(fields=['user', 'name']),
         ]
+        constraints = [
+            models.CheckConstraint(condition=_VALID_BLOOD_GROUP_Q, name='familymember_valid_blood_group'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.relation})"
 
-    def calculate_age(self):
-        """Calculate age from date of birth"""
-        if self.date_of_birth:
-            today = timezone.now().date()
-            age = today.year - self.date_of_birth.year
-            if today.month < self.date_of_birth.month or \
-                    (today.month == self.date_of_birth.month and today.day < self.date_of_birth.day):
-                age -= 1
-            return age
+    def calculate_age(self, today=None):
+        """Calculate age from date of birth (pass `today` when computing many ages)"""
+        dob = self.date_of_birth
+        if dob:
+            today = today or timezone.localdate()
+            # Subtract one if this year's birthday hasn't happened yet
+            return today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
         return self.age  # Return manual age if DOB not set
 
     @property
@@ -267,13 +311,16 @@ class Vaccine(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UserScopedManager()
+
     class Meta:
         ordering = ['-date_administered']
         verbose_name = 'Vaccine'
         verbose_name_plural = 'Vaccines'
         indexes = [
+            models.Index(fields=['-date_administered']),
             models.Index(fields=['user', 'date_administered']),
-            models.Index(fields=['status']),
+            models.Index(fields=['user', 'status', 'date_administered']),
             models.Index(fields=['family_member']),
         ]
 
@@ -283,20 +330,20 @@ class Vaccine(models.Model):
             return f"{self.name} - {self.dose_number} for {self.family_member.name}"
         return f"{self.name} - {self.dose_number} for {self.user.get_full_name() or self.user.username}"
 
-    def is_upcoming(self):
+    def is_upcoming(self, today=None):
         """Check if vaccine is scheduled for future"""
-        return self.date_administered > timezone.now().date()
+        return self.date_administered > (today or timezone.now().date())
 
-    def is_overdue(self):
+    def is_overdue(self, today=None):
         """Check if vaccine is overdue"""
         return (
                 self.status == 'Scheduled' and
-                self.date_administered < timezone.now().date()
+                self.date_administered < (today or timezone.now().date())
         )
 
-    def days_until(self):
+    def days_until(self, today=None):
         """Calculate days until vaccine date"""
-        delta = self.date_administered - timezone.now().date()
+        delta = self.date_administered - (today or timezone.now().date())
         return delta.days
 
     def get_recipient_name(self):
@@ -317,7 +364,14 @@ class Reminder(models.Model):
     )
     vaccine_name = models.CharField(max_length=255, help_text="Name of vaccine")
     scheduled_datetime = models.DateTimeField(help_text="When to send reminder")
-    family_member = models.CharField(max_length=255, help_text="Family member name")
+    family_member = models.ForeignKey(
+        'FamilyMember',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='reminders',
+        help_text="Family member this reminder is for (blank for yourself)"
+    )
     completed = models.BooleanField(default=False, help_text="Has the reminder been acknowledged")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -327,12 +381,24 @@ class Reminder(models.Model):
         verbose_name = 'Reminder'
         verbose_name_plural = 'Reminders'
         indexes = [
+            models.Index(fields=['-scheduled_datetime']),
             models.Index(fields=['user', 'scheduled_datetime']),
-            models.Index(fields=['completed']),
+            # Active-reminder lookups only ever touch uncompleted rows
+            models.Index(
+                fields=['user', 'scheduled_datetime'],
+                condition=models.Q(completed=False),
+                name='rem_active_user_dt'
+            ),
         ]
 
     def __str__(self):
-        return f"{self.vaccine_name} for {self.family_member} on {self.scheduled_datetime.strftime('%Y-%m-%d %H:%M')}"
+        return f"{self.vaccine_name} for {self.get_recipient_name()} on {self.scheduled_datetime.strftime('%Y-%m-%d %H:%M')}"
+
+    def get_recipient_name(self):
+        """Get the name of the person the reminder is for"""
+        if self.family_member:
+            return self.family_member.name
+        return self.user.get_full_name() or self.user.username
 
     @property
     def status(self):
@@ -376,6 +442,21 @@ class Reminder(models.Model):
 # NEW MODELS: VACCINATION CENTERS AND NEWS
 # =====================================================
 
+class VaccineOption(models.Model):
+    """
+    A vaccine that vaccination centers can offer
+    """
+    name = models.CharField(max_length=100, unique=True, help_text="Vaccine name")
+
+    class Meta:
+        ordering = ['name']
+        verbose_name = 'Vaccine Option'
+        verbose_name_plural = 'Vaccine Options'
+
+    def __str__(self):
+        return self.name
+
+
 class VaccinationCenter(models.Model):
     """
     Model for vaccination centers/hospitals
@@ -402,10 +483,11 @@ class VaccinationCenter(models.Model):
     closing_time = models.TimeField(blank=True, null=True, help_text="Closing time")
 
     # Services
-    available_vaccines = models.TextField(
+    vaccines = models.ManyToManyField(
+        VaccineOption,
         blank=True,
-        null=True,
-        help_text="List of available vaccines (comma-separated)"
+        related_name='centers',
+        help_text="Vaccines available at this center"
     )
 
     # Status
@@ -447,7 +529,9 @@ class VaccinationCenter(models.Model):
         verbose_name = 'Vaccination Center'
         verbose_name_plural = 'Vaccination Centers'
         indexes = [
-            models.Index(fields=['city', 'is_active']),
+            models.Index(fields=['city', 'name']),
+            # Public list: active centers, optionally by city, sorted by city/name
+            models.Index(fields=['is_active', 'city', 'name']),
         ]
 
     def __str__(self):
@@ -460,10 +544,8 @@ class VaccinationCenter(models.Model):
         return "Not specified"
 
     def get_vaccines_list(self):
-        """Get list of available vaccines"""
-        if self.available_vaccines:
-            return [v.strip() for v in self.available_vaccines.split(',')]
-        return []
+        """Get list of available vaccines (uses prefetched vaccines if present)"""
+        return [v.name for v in self.vaccines.all()]
 
 
 class News(models.Model):
@@ -519,14 +601,26 @@ class News(models.Model):
 
     # Engagement
     views = models.PositiveIntegerField(default=0, help_text="Number of views")
+    reading_time_minutes = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        help_text="Estimated reading time, computed from content on save"
+    )
 
     class Meta:
         ordering = ['-published_date']
         verbose_name = 'News Article'
         verbose_name_plural = 'News Articles'
         indexes = [
-            models.Index(fields=['-published_date', 'is_published']),
+            # Published list: equality column first, then the sort key
+            models.Index(fields=['is_published', '-published_date']),
             models.Index(fields=['category']),
+            # news_list featured strip: only published + featured rows, newest first
+            models.Index(
+                fields=['-published_date'],
+                condition=models.Q(is_published=True, is_featured=True),
+                name='news_featured_idx',
+            ),
         ]
 
     def __str__(self):
@@ -535,23 +629,37 @@ class News(models.Model):
     def save(self, *args, **kwargs):
         """Auto-generate slug if not provided"""
         if not self.slug:
-            from django.utils.text import slugify
-            base_slug = slugify(self.title)
+            max_length = self._meta.get_field('slug').max_length
+            # Cutting a slug can leave a trailing hyphen; strip it after each cut
+            base_slug = slugify(self.title)[:max_length].rstrip('-')
+            # Fetch every slug that could collide in one query and probe in memory.
+            # The stem is shortened to cover suffixed slugs truncated to fit max_length.
+            taken = set(
+                News.objects.filter(slug__startswith=base_slug[:max_length - 10])
+                .values_list('slug', flat=True)
+            )
             slug = base_slug
             counter = 1
-            while News.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
+            while slug in taken:
+                suffix = f"-{counter}"
+                slug = f"{base_slug[:max_length - len(suffix)].rstrip('-')}{suffix}"
                 counter += 1
             self.slug = slug
+
+        # Word-count the content at write time so reads don't have to
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'content' in update_fields:
+            self.reading_time_minutes = max(1, len(self.content.split()) // 200)  # 200 words per minute
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'reading_time_minutes'}
         super().save(*args, **kwargs)
 
     def increment_views(self):
-        """Increment view count"""
+        """Increment view count atomically in the database"""
+        News.objects.filter(pk=self.pk).update(views=F('views') + 1)
+        # Mirror the increment locally so templates show the new count without a re-read
         self.views += 1
-        self.save(update_fields=['views'])
 
     def get_reading_time(self):
-        """Calculate estimated reading time in minutes"""
-        words = len(self.content.split())
-        minutes = max(1, words // 200)  # Assuming 200 words per minute
-        return f"{minutes} min read"
\ No newline at end of file
+        """Get estimated reading time for display"""
+        return f"{self.reading_time_minutes} min read"
\ No newline at end of file
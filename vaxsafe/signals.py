@@ -0,0 +1,81 @@
+# signals.py - Cache invalidation for VaxSafe
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from .models import Profile, FamilyMember, Vaccine, Reminder, VaccinationCenter, VaccineOption
+
+
+def dashboard_cache_key(user_id):
+    """Cache key for a user's dashboard counts"""
+    return f"dash:{user_id}"
+
+
+@receiver([post_save, post_delete], sender=Vaccine)
+@receiver([post_save, post_delete], sender=Reminder)
+@receiver([post_save, post_delete], sender=FamilyMember)
+def invalidate_dashboard(sender, instance, **kwargs):
+    """Drop the owner's cached dashboard counts when their records change"""
+    cache.delete(dashboard_cache_key(instance.user_id))
+
+
+def center_cache_key(center_id):
+    """Cache key for a vaccination center's detail data"""
+    return f"center:{center_id}"
+
+
+def invalidate_centers(center_ids):
+    """Drop the cached detail entries for these centers"""
+    cache.delete_many([center_cache_key(pk) for pk in center_ids])
+
+
+@receiver([post_save, post_delete], sender=VaccinationCenter)
+def invalidate_center(sender, instance, **kwargs):
+    invalidate_centers([instance.pk])
+
+
+@receiver(m2m_changed, sender=VaccinationCenter.vaccines.through)
+def invalidate_center_vaccines(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith('post_'):
+            invalidate_centers([instance.pk])
+        return
+    # Changed from the VaccineOption side: pk_set holds center ids, except
+    # on clear, where the affected centers must be read before removal
+    if action in ('post_add', 'post_remove'):
+        center_ids = pk_set
+    elif action == 'pre_clear':
+        center_ids = instance.centers.values_list('id', flat=True)
+    else:
+        return
+    invalidate_centers(center_ids)
+
+
+@receiver([post_save, pre_delete], sender=VaccineOption)
+def invalidate_option_centers(sender, instance, **kwargs):
+    """A renamed or removed vaccine changes every center that lists it"""
+    invalidate_centers(instance.centers.values_list('id', flat=True))
+
+
+@receiver(post_save, sender=User)
+def create_profile(sender, instance, created, raw=False, **kwargs):
+    """Give every new account a profile so views can read user.profile directly"""
+    if created and not raw:
+        Profile.objects.create(user=instance)
+
+
+@receiver(post_save, sender=FamilyMember)
+def increment_family_members_count(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        Profile.objects.filter(user_id=instance.user_id).update(
+            family_members_count=F('family_members_count') + 1
+        )
+
+
+@receiver(post_delete, sender=FamilyMember)
+def decrement_family_members_count(sender, instance, **kwargs):
+    Profile.objects.filter(user_id=instance.user_id, family_members_count__gt=0).update(
+        family_members_count=F('family_members_count') - 1
+    )
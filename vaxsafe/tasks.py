@@ -0,0 +1,45 @@
+# tasks.py - Background jobs for VaxSafe
+import logging
+import threading
+
+from django.conf import settings
+from django.core.mail import send_mail
+
+logger = logging.getLogger(__name__)
+
+
+def run_in_background(func, *args):
+    """Run func on a daemon thread so slow calls like SMTP don't hold up the request"""
+    # Exceptions can't reach the caller from here, so _run_logged logs them
+    thread = threading.Thread(target=_run_logged, args=(func, *args), daemon=True)
+    thread.start()
+    return thread
+
+
+def _run_logged(func, *args):
+    try:
+        func(*args)
+    except Exception:
+        logger.exception("Background task %s failed", func.__name__)
+
+
+def send_otp_email(email, otp):
+    """Send the registration verification code"""
+    send_mail(
+        subject="Your VaxSafe Verification Code",
+        message=f"Your verification code is: {otp}\n\nThis code will expire in 5 minutes.",
+        from_email=settings.EMAIL_HOST_USER,
+        recipient_list=[email],
+        fail_silently=False,
+    )
+
+
+def send_contact_email(name, email, message):
+    """Forward a contact form submission to the site inbox"""
+    send_mail(
+        subject=f"New Message from {name}",
+        message=f"From: {name} ({email})\n\n{message}",
+        from_email=settings.EMAIL_HOST_USER,
+        recipient_list=[settings.DEFAULT_FROM_EMAIL],
+        fail_silently=False,
+    )
@@ -1,3 +1,460 @@
-from django.test import TestCase
+import datetime
+import hashlib
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import BACKEND_SESSION_KEY
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.http import HttpResponse
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .backends import ProfileModelBackend
+from .forms import ProfileForm
+from .models import FamilyMember, News, Profile, Reminder, Vaccine, VaccinationCenter, VaccineOption
+from .signals import center_cache_key, dashboard_cache_key
+from .views import hash_otp
+
+
+# Production caches need a shared Redis; a single test process can use LocMem
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class VaxSafeTestCase(TestCase):
+    """Logged-in user with one family member and one upcoming vaccine"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('user@example.com', 'user@example.com', 'pass12345', first_name='User')
+        self.member = FamilyMember.objects.create(user=self.user, name='Kid', relation='Child')
+        self.vaccine = Vaccine.objects.create(
+            user=self.user,
+            family_member=self.member,
+            name='Polio',
+            date_administered=timezone.localdate() + datetime.timedelta(days=3),
+        )
+        self.client.force_login(self.user)
+
+    def queries_touching(self, table, func):
+        """SQL statements run by func() that mention the given table"""
+        with CaptureQueriesContext(connection) as ctx:
+            func()
+        return [q['sql'] for q in ctx.captured_queries if f'"{table}"' in q['sql']]
+
+
+class MigrationTestCase(TransactionTestCase):
+    """Runs the schema back to migrate_from so data migrations can be exercised"""
+
+    migrate_from = None
+    migrate_to = None
+
+    def setUp(self):
+        self.leaf = MigrationExecutor(connection).loader.graph.leaf_nodes('vaxsafe')
+        self.apps = self.migrate(self.migrate_from)
+
+    def tearDown(self):
+        self.migrate(self.leaf[0][1])
+
+    def migrate(self, name):
+        """Migrate vaxsafe to the named migration and return its historical apps"""
+        target = [('vaxsafe', name)]
+        executor = MigrationExecutor(connection)
+        executor.migrate(target)
+        executor.loader.build_graph()
+        return executor.loader.project_state(target).apps
+
+
+# =====================================================
+# DASHBOARD
+# =====================================================
+class DashboardTests(VaxSafeTestCase):
+
+    def test_cache_hit_runs_no_vaccine_queries(self):
+        self.client.get('/dashboard/')
+        self.assertEqual(self.queries_touching('vaxsafe_vaccine', lambda: self.client.get('/dashboard/')), [])
+
+    def test_record_changes_clear_cached_counts(self):
+        key = dashboard_cache_key(self.user.pk)
+        changes = [
+            lambda: Vaccine.objects.create(user=self.user, name='MMR', date_administered=timezone.localdate()),
+            lambda: self.vaccine.delete(),
+            lambda: FamilyMember.objects.create(user=self.user, name='Other', relation='Spouse'),
+            lambda: Reminder.objects.create(
+                user=self.user, vaccine_name='Flu', scheduled_datetime=timezone.now() + datetime.timedelta(days=1)
+            ),
+        ]
+        for change in changes:
+            self.client.get('/dashboard/')
+            self.assertIsNotNone(cache.get(key))
+            change()
+            self.assertIsNone(cache.get(key))
+
+
+# =====================================================
+# AUTHENTICATION BACKEND
+# =====================================================
+class ProfileModelBackendTests(VaxSafeTestCase):
+
+    def test_get_user_loads_profile_in_one_query(self):
+        with self.assertNumQueries(1):
+            user = ProfileModelBackend().get_user(self.user.pk)
+            self.assertEqual(user.profile.family_members_count, 1)
+
+    def test_get_user_rejects_missing_and_inactive_users(self):
+        self.assertIsNone(ProfileModelBackend().get_user(self.user.pk + 1000))
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertIsNone(ProfileModelBackend().get_user(self.user.pk))
+
+    def test_login_uses_profile_backend(self):
+        self.client.logout()
+        self.client.login(username='user@example.com', password='pass12345')
+        self.assertEqual(self.client.session[BACKEND_SESSION_KEY], 'vaxsafe.backends.ProfileModelBackend')
+
+    def test_sessions_from_the_default_backend_still_resolve(self):
+        self.client.force_login(self.user, backend='django.contrib.auth.backends.ModelBackend')
+        response = self.client.get('/profile/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['user'].pk, self.user.pk)
+
+    def test_request_user_comes_with_profile(self):
+        self.client.get('/dashboard/')
+        profile_queries = self.queries_touching('vaxsafe_profile', lambda: self.client.get('/profile/'))
+        self.assertEqual(len(profile_queries), 1)
+        self.assertIn('"auth_user"', profile_queries[0])
+
+
+# =====================================================
+# PROFILE
+# =====================================================
+class ProfileCountTests(VaxSafeTestCase):
+
+    def test_signals_track_family_members(self):
+        self.assertEqual(Profile.objects.get(user=self.user).family_members_count, 1)
+        extra = FamilyMember.objects.create(user=self.user, name='Other', relation='Spouse')
+        self.assertEqual(Profile.objects.get(user=self.user).family_members_count, 2)
+        extra.delete()
+        self.assertEqual(Profile.objects.get(user=self.user).family_members_count, 1)
+
+    def test_saving_a_stale_profile_keeps_the_count(self):
+        profile = Profile.objects.get(user=self.user)
+        FamilyMember.objects.create(user=self.user, name='Other', relation='Spouse')
+        profile.mobile = '01700000000'
+        profile.save()
+        profile = Profile.objects.get(user=self.user)
+        self.assertEqual(profile.mobile, '01700000000')
+        self.assertEqual(profile.family_members_count, 2)
+
+    def test_profile_form_keeps_the_count(self):
+        form = ProfileForm({'mobile': '01700000000'}, instance=Profile.objects.get(user=self.user))
+        FamilyMember.objects.create(user=self.user, name='Other', relation='Spouse')
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        self.assertEqual(Profile.objects.get(user=self.user).family_members_count, 2)
+
+
+# =====================================================
+# FAMILY MEMBERS
+# =====================================================
+class FamilyMembersTests(VaxSafeTestCase):
+
+    def test_list_shows_fresh_vaccine_counts(self):
+        self.client.get('/familymembers/')
+        Vaccine.objects.create(user=self.user, family_member=self.member, name='MMR', date_administered=timezone.localdate())
+        response = self.client.get('/familymembers/')
+        self.assertEqual(response.context['members'][0].vaccine_count, 2)
+
+
+# =====================================================
+# VACCINE SCHEDULE
+# =====================================================
+class VaccineScheduleTests(VaxSafeTestCase):
+    """Past-due Scheduled doses read as Overdue without being written"""
+
+    def setUp(self):
+        super().setUp()
+        today = timezone.localdate()
+        self.past_due = Vaccine.objects.create(
+            user=self.user, name='MMR', date_administered=today - datetime.timedelta(days=2)
+        )
+        self.marked_overdue = Vaccine.objects.create(
+            user=self.user, name='BCG', status='Overdue', date_administered=today - datetime.timedelta(days=9)
+        )
+        self.completed = Vaccine.objects.create(
+            user=self.user, name='Flu', status='Completed', date_administered=today - datetime.timedelta(days=5)
+        )
+
+    def schedule_ids(self, response):
+        return {v.id for section in ('upcoming_vaccines', 'past_vaccines') for v in response.context[section]}
+
+    def test_overdue_count_includes_past_due_scheduled(self):
+        response = self.client.get('/vaccine/schedule/')
+        self.assertEqual(response.context['total_count'], 4)
+        self.assertEqual(response.context['overdue_count'], 2)
+        self.assertEqual(response.context['completed_count'], 1)
+        self.assertEqual(Vaccine.objects.get(id=self.past_due.id).status, 'Scheduled')
+
+    def test_overdue_filter(self):
+        response = self.client.get('/vaccine/schedule/', {'status': 'Overdue'})
+        self.assertEqual(self.schedule_ids(response), {self.past_due.id, self.marked_overdue.id})
+
+    def test_scheduled_filter_leaves_out_past_due(self):
+        response = self.client.get('/vaccine/schedule/', {'status': 'Scheduled'})
+        self.assertEqual(self.schedule_ids(response), {self.vaccine.id})
+        self.assertEqual(response.context['overdue_count'], 0)
+
+    def test_overdue_list(self):
+        with mock.patch('vaxsafe.views.render', return_value=HttpResponse()) as render:
+            self.client.get('/vaccine/overdue/')
+        context = render.call_args.args[2]
+        self.assertEqual([v.id for v in context['vaccinations']], [self.marked_overdue.id, self.past_due.id])
+        self.assertEqual(context['count'], 2)
+
+
+# =====================================================
+# REMINDERS
+# =====================================================
+class EditReminderTests(VaxSafeTestCase):
+
+    def test_bulk_edit_stamps_updated_at(self):
+        reminder = Reminder.objects.create(
+            user=self.user, vaccine_name='Flu', scheduled_datetime=timezone.now() + datetime.timedelta(days=1)
+        )
+        stale = timezone.now() - datetime.timedelta(days=30)
+        Reminder.objects.filter(pk=reminder.pk).update(updated_at=stale)
+
+        self.client.post('/reminders/edit/', {
+            f'vaccine_name_{reminder.id}': 'Flu booster',
+            f'scheduled_{reminder.id}': '2031-01-01T10:00+06:00',
+            f'family_member_{reminder.id}': str(self.member.id),
+        })
+        reminder.refresh_from_db()
+        self.assertEqual(reminder.vaccine_name, 'Flu booster')
+        self.assertEqual(reminder.family_member, self.member)
+        self.assertGreater(reminder.updated_at, stale)
+
+
+# =====================================================
+# VACCINATION CENTERS
+# =====================================================
+class CentersViewTests(VaxSafeTestCase):
+
+    def test_unrendered_total_runs_no_count(self):
+        VaccinationCenter.objects.create(name='Central', address='Road 1', city='Dhaka')
+        response = self.client.get('/centers/')
+        self.assertEqual(self.queries_touching('vaxsafe_vaccinationcenter', lambda: self.client.get('/centers/')), [])
+        self.assertEqual(response.context['total_centers'](), 1)
+
+
+class CenterCacheInvalidationTests(VaxSafeTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.center = VaccinationCenter.objects.create(name='Central', address='Road 1', city='Dhaka')
+        self.option = VaccineOption.objects.create(name='Polio')
+        self.center.vaccines.add(self.option)
+        self.key = center_cache_key(self.center.pk)
+
+    def assertClears(self, change):
+        cache.set(self.key, {'center': self.center})
+        change()
+        self.assertIsNone(cache.get(self.key))
+
+    def test_center_save_clears(self):
+        def rename():
+            self.center.name = 'Renamed'
+            self.center.save()
+        self.assertClears(rename)
+
+    def test_vaccine_changes_clear_from_either_side(self):
+        other = VaccineOption.objects.create(name='MMR')
+        self.assertClears(lambda: self.center.vaccines.add(other))
+        self.assertClears(lambda: self.center.vaccines.remove(other))
+        self.assertClears(lambda: other.centers.add(self.center))
+        self.assertClears(lambda: other.centers.clear())
+        self.assertClears(lambda: self.center.vaccines.clear())
+
+    def test_option_rename_and_delete_clear(self):
+        def rename():
+            self.option.name = 'Polio (IPV)'
+            self.option.save()
+        self.assertClears(rename)
+        self.assertClears(self.option.delete)
+
+
+# =====================================================
+# NEWS
+# =====================================================
+class NewsDetailTests(VaxSafeTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.news = News.objects.create(title='Polio drive', summary='s', content='word ' * 50)
+
+    def test_view_is_counted_before_the_response(self):
+        response = self.client.get(f'/news/{self.news.slug}/')
+        self.assertEqual(response.context['news'].views, 1)
+        self.news.refresh_from_db()
+        self.assertEqual(self.news.views, 1)
+
+    def test_related_news_excludes_the_article(self):
+        for i in range(4):
+            News.objects.create(title=f'Drive {i}', summary='s', content='word')
+        response = self.client.get(f'/news/{self.news.slug}/')
+        related = list(response.context['related_news'])
+        self.assertEqual(len(related), 3)
+        self.assertNotIn(self.news, related)
+
+
+class NewsSlugTests(TestCase):
+
+    def create(self, title):
+        return News.objects.create(title=title, summary='s', content='word')
+
+    def test_duplicate_titles_get_numbered_slugs(self):
+        slugs = [self.create('Polio drive').slug for _ in range(3)]
+        self.assertEqual(slugs, ['polio-drive', 'polio-drive-1', 'polio-drive-2'])
+
+    def test_collisions_are_probed_in_one_query(self):
+        for _ in range(5):
+            self.create('Polio drive')
+        # One SELECT for the taken slugs, one INSERT
+        with self.assertNumQueries(2):
+            self.assertEqual(self.create('Polio drive').slug, 'polio-drive-5')
+
+    def test_truncated_slug_drops_trailing_hyphen(self):
+        self.assertEqual(self.create('a' * 299 + ' long').slug, 'a' * 299)
+
+    def test_truncated_duplicates_stay_unique(self):
+        title = 'a' * 297 + ' bb more'
+        slugs = [self.create(title).slug for _ in range(12)]
+        self.assertEqual(slugs[0], 'a' * 297 + '-bb')
+        self.assertEqual(slugs[1], 'a' * 297 + '-1')
+        self.assertEqual(slugs[11], 'a' * 297 + '-11')
+        self.assertEqual(len(set(slugs)), 12)
+        self.assertTrue(all(len(slug) <= 300 and '--' not in slug for slug in slugs))
+
+
+# =====================================================
+# OTP
+# =====================================================
+class OtpHashTests(TestCase):
+
+    def test_hash_is_keyed_and_stable(self):
+        self.assertEqual(hash_otp('123456'), hash_otp('123456'))
+        self.assertNotEqual(hash_otp('123456'), hash_otp('123457'))
+        self.assertNotEqual(hash_otp('123456'), hashlib.sha256(b'123456').hexdigest())
+
+    def test_session_stores_digest_not_code(self):
+        with mock.patch('vaxsafe.views.random.randint', return_value=123456), \
+                mock.patch('vaxsafe.views.run_in_background'):
+            self.client.post('/register/', {
+                'full_name': 'New User',
+                'email': 'new@example.com',
+                'password': 'pass12345',
+                'reset_password': 'pass12345',
+            })
+        state = self.client.session['otp_state']
+        self.assertNotEqual(state['code'], '123456')
+        self.assertEqual(state['code'], hash_otp('123456'))
+
+
+# =====================================================
+# MIGRATIONS
+# =====================================================
+class ReadingTimeMigrationTests(MigrationTestCase):
+    migrate_from = '0003_news_vaccinationcenter_alter_reminder_options_and_more'
+    migrate_to = '0005_news_reading_time_minutes'
+
+    def test_backfills_reading_time(self):
+        News = self.apps.get_model('vaxsafe', 'News')
+        long_id = News.objects.create(title='Long', slug='long', summary='s', content='word ' * 450).id
+        short_id = News.objects.create(title='Short', slug='short', summary='s', content='word').id
+
+        News = self.migrate(self.migrate_to).get_model('vaxsafe', 'News')
+        self.assertEqual(News.objects.get(id=long_id).reading_time_minutes, 2)
+        self.assertEqual(News.objects.get(id=short_id).reading_time_minutes, 1)
+
+        News = self.migrate(self.migrate_from).get_model('vaxsafe', 'News')
+        self.assertEqual(News.objects.count(), 2)
+
+
+class FamilyMembersCountMigrationTests(MigrationTestCase):
+    migrate_from = '0011_auth_user_email_index'
+    migrate_to = '0012_profile_family_members_count'
+
+    def test_backfills_family_members_count(self):
+        User = self.apps.get_model('auth', 'User')
+        Profile = self.apps.get_model('vaxsafe', 'Profile')
+        FamilyMember = self.apps.get_model('vaxsafe', 'FamilyMember')
+        parent = User.objects.create(username='parent@example.com')
+        single = User.objects.create(username='single@example.com')
+        Profile.objects.create(user=parent)
+        Profile.objects.create(user=single)
+        FamilyMember.objects.create(user=parent, name='Kid', relation='Child')
+        FamilyMember.objects.create(user=parent, name='Partner', relation='Spouse')
+
+        Profile = self.migrate(self.migrate_to).get_model('vaxsafe', 'Profile')
+        counts = dict(Profile.objects.values_list('user_id', 'family_members_count'))
+        self.assertEqual(counts, {parent.id: 2, single.id: 0})
+
+        Profile = self.migrate(self.migrate_from).get_model('vaxsafe', 'Profile')
+        self.assertEqual(Profile.objects.count(), 2)
+
+
+class ReminderFamilyMemberMigrationTests(MigrationTestCase):
+    migrate_from = '0012_profile_family_members_count'
+    migrate_to = '0013_reminder_family_member_fk'
+
+    def test_links_matched_and_creates_unmatched_members(self):
+        User = self.apps.get_model('auth', 'User')
+        Profile = self.apps.get_model('vaxsafe', 'Profile')
+        FamilyMember = self.apps.get_model('vaxsafe', 'FamilyMember')
+        Reminder = self.apps.get_model('vaxsafe', 'Reminder')
+        user = User.objects.create(username='user@example.com')
+        Profile.objects.create(user=user, family_members_count=1)
+        kid = FamilyMember.objects.create(user=user, name='Kid', relation='Child')
+        when = timezone.now()
+        matched = Reminder.objects.create(user=user, vaccine_name='Polio', scheduled_datetime=when, family_member=' kid ')
+        unmatched = Reminder.objects.create(user=user, vaccine_name='MMR', scheduled_datetime=when, family_member='Rafi')
+        repeat = Reminder.objects.create(user=user, vaccine_name='Flu', scheduled_datetime=when, family_member='rafi')
+        own = Reminder.objects.create(user=user, vaccine_name='Tetanus', scheduled_datetime=when, family_member='')
+
+        apps = self.migrate(self.migrate_to)
+        Reminder = apps.get_model('vaxsafe', 'Reminder')
+        FamilyMember = apps.get_model('vaxsafe', 'FamilyMember')
+        self.assertEqual(Reminder.objects.get(id=matched.id).family_member_id, kid.id)
+        self.assertIsNone(Reminder.objects.get(id=own.id).family_member_id)
+        rafi = Reminder.objects.get(id=unmatched.id).family_member
+        self.assertEqual((rafi.name, rafi.relation), ('Rafi', 'Other'))
+        self.assertEqual(Reminder.objects.get(id=repeat.id).family_member_id, rafi.id)
+        self.assertEqual(FamilyMember.objects.filter(user_id=user.id).count(), 2)
+        self.assertEqual(apps.get_model('vaxsafe', 'Profile').objects.get(user_id=user.id).family_members_count, 2)
+
+        Reminder = self.migrate(self.migrate_from).get_model('vaxsafe', 'Reminder')
+        names = dict(Reminder.objects.values_list('id', 'family_member'))
+        self.assertEqual(names, {matched.id: 'Kid', unmatched.id: 'Rafi', repeat.id: 'Rafi', own.id: ''})
+
+
+class CenterVaccinesMigrationTests(MigrationTestCase):
+    migrate_from = '0013_reminder_family_member_fk'
+    migrate_to = '0014_vaccinationcenter_vaccines'
+
+    def test_splits_and_joins_vaccine_lists(self):
+        Center = self.apps.get_model('vaxsafe', 'VaccinationCenter')
+        first = Center.objects.create(name='First', address='a', city='Dhaka', available_vaccines='Polio, MMR,,Polio ')
+        second = Center.objects.create(name='Second', address='b', city='Dhaka', available_vaccines='MMR')
+        empty = Center.objects.create(name='Empty', address='c', city='Dhaka', available_vaccines=None)
+
+        apps = self.migrate(self.migrate_to)
+        Center = apps.get_model('vaxsafe', 'VaccinationCenter')
+        self.assertEqual(
+            list(apps.get_model('vaxsafe', 'VaccineOption').objects.order_by('name').values_list('name', flat=True)),
+            ['MMR', 'Polio'],
+        )
+        vaccines = {c.id: sorted(v.name for v in c.vaccines.all()) for c in Center.objects.prefetch_related('vaccines')}
+        self.assertEqual(vaccines, {first.id: ['MMR', 'Polio'], second.id: ['MMR'], empty.id: []})
+
+        Center = self.migrate(self.migrate_from).get_model('vaxsafe', 'VaccinationCenter')
+        lists = dict(Center.objects.values_list('id', 'available_vaccines'))
+        self.assertEqual(lists, {first.id: 'MMR, Polio', second.id: 'MMR', empty.id: None})
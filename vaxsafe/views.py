@@ -1,20 +1,51 @@
 # views.py - Complete and Optimized with Centers and News
+import hmac
+import logging
 import random
 import time
-from django.core.mail import send_mail
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.models import User
 from django.contrib import messages
 from django.contrib.auth import authenticate, login as auth_login, logout as auth_logout
 from django.contrib.auth.decorators import login_required
-from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
 from django.http import HttpResponse
 from django.utils import timezone
+from django.utils.crypto import salted_hmac
 from django.utils.dateparse import parse_datetime
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Case, CharField, Count, F, Q, Value, When
 
 from .models import Profile, FamilyMember, Reminder, Update, Vaccine, VaccinationCenter, News
 from .forms import ProfileForm, FamilyMemberForm, VaccineForm
+from .signals import center_cache_key, dashboard_cache_key
+from .tasks import run_in_background, send_otp_email, send_contact_email
+
+logger = logging.getLogger(__name__)
+
+# Seconds a user's dashboard counts may be served from cache
+DASHBOARD_CACHE_TIMEOUT = 60
+
+# Seconds a center's detail data may be served from cache (signals clear it on edits)
+CENTER_CACHE_TIMEOUT = 60 * 15
+
+# Vaccine cards per page in each vaccine_schedule section
+SCHEDULE_PAGE_SIZE = 25
+
+# Article cards per page on the news list
+NEWS_PAGE_SIZE = 24
+
+# Filter dropdown choices, bound once at import
+_CITY_CHOICES = tuple(VaccinationCenter.CITY_CHOICES)
+_NEWS_CATEGORIES = tuple(News.CATEGORY_CHOICES)
+
+# Columns the vaccine list pages render, including what get_recipient_name reads
+_VACCINE_LIST_FIELDS = (
+    'id', 'name', 'dose_number', 'date_administered', 'status',
+    'location', 'manufacturer', 'notes',
+    'family_member__name', 'user__username', 'user__first_name', 'user__last_name',
+)
 
 
 # =====================================================
@@ -49,18 +80,8 @@ def send_message(request):
         message = request.POST.get('message', '')
 
         if name and email and message:
-            try:
-                send_mail(
-                    subject=f"New Message from {name}",
-                    message=f"From: {name} ({email})\n\n{message}",
-                    from_email=settings.EMAIL_HOST_USER,
-                    recipient_list=[settings.DEFAULT_FROM_EMAIL],
-                    fail_silently=False,
-                )
-                messages.success(request, "Thank you for contacting us! We'll get back to you soon.")
-            except Exception as e:
-                messages.error(request, "Failed to send message. Please try again later.")
-                print(f"Email error: {e}")
+            run_in_background(send_contact_email, name, email, message)
+            messages.success(request, "Thank you for contacting us! Your message is on its way.")
         else:
             messages.error(request, "Please fill in all fields.")
 
@@ -73,26 +94,22 @@ def send_message(request):
 # OTP HELPER FUNCTIONS
 # =====================================================
 
+def hash_otp(otp):
+    """Keyed digest stored in the session instead of the plaintext code"""
+    return salted_hmac('vaxsafe.otp', otp).hexdigest()
+
+
 def send_otp(request, email):
-    """Generate and send OTP to email"""
+    """Generate an OTP and start emailing it"""
     otp = str(random.randint(100000, 999999))
-    request.session['otp'] = otp
-    request.session['email'] = email
-    request.session['otp_time'] = time.time()
+    # One session entry for the whole OTP state, with an integer timestamp
+    request.session['otp_state'] = {
+        'code': hash_otp(otp),
+        'email': email,
+        'ts': int(time.time()),
+    }
 
-    try:
-        send_mail(
-            subject="Your VaxSafe Verification Code",
-            message=f"Your verification code is: {otp}\n\nThis code will expire in 5 minutes.",
-            from_email=settings.EMAIL_HOST_USER,
-            recipient_list=[email],
-            fail_silently=False,
-        )
-        return True
-    except Exception as e:
-        print(f"Email sending failed: {e}")
-        messages.error(request, "Could not send OTP. Please try again later.")
-        return False
+    run_in_background(send_otp_email, email, otp)
 
 
 # =====================================================
@@ -120,14 +137,11 @@ def register(request):
             messages.error(request, "Password must be at least 6 characters long.")
             return render(request, "htmlpages/register.html")
 
-        if User.objects.filter(email=email).exists():
+        # Accounts use the email as username, so check both in one query
+        if User.objects.filter(Q(email=email) | Q(username=email)).exists():
             messages.error(request, "Email is already registered.")
             return render(request, "htmlpages/register.html")
 
-        if User.objects.filter(username=email).exists():
-            messages.error(request, "This email is already in use.")
-            return render(request, "htmlpages/register.html")
-
         # Save temp user data
         request.session['temp_user'] = {
             "full_name": full_name,
@@ -135,9 +149,9 @@ def register(request):
             "password": password,
         }
 
-        if send_otp(request, email):
-            messages.info(request, "OTP sent to your email.")
-            return redirect("verify")
+        send_otp(request, email)
+        messages.info(request, "We're sending an OTP to your email. It may take a minute to arrive.")
+        return redirect("verify")
 
     return render(request, "htmlpages/register.html")
 
@@ -149,35 +163,34 @@ def verify(request):
 
         if action == "submit":
             entered_otp = request.POST.get("otp", "").strip()
-            saved_otp = request.session.get("otp")
-            otp_time = request.session.get("otp_time")
+            otp_state = request.session.get("otp_state") or {}
+            saved_hash = otp_state.get("code")
+            otp_time = otp_state.get("ts")
 
             # Expiry check (5 minutes)
             if otp_time and time.time() - otp_time > 300:
                 messages.error(request, "OTP expired. Please resend.")
                 return render(request, "htmlpages/verify.html")
 
-            if entered_otp == saved_otp:
+            if saved_hash and hmac.compare_digest(hash_otp(entered_otp), saved_hash):
                 data = request.session.get("temp_user")
 
                 if data:
                     try:
-                        # Create user
-                        user = User.objects.create_user(
-                            username=data["email"],
-                            email=data["email"],
-                            password=data["password"],
-                            first_name=data["full_name"]
-                        )
-
-                        # Create profile
-                        Profile.objects.create(user=user)
+                        # Create user; the post_save signal adds the profile in the same transaction
+                        with transaction.atomic():
+                            user = User.objects.create_user(
+                                username=data["email"],
+                                email=data["email"],
+                                password=data["password"],
+                                first_name=data["full_name"]
+                            )
 
                         # Auto login
                         auth_login(request, user)
 
                         # Clear session
-                        for key in ["otp", "otp_time", "temp_user", "email"]:
+                        for key in ["otp_state", "temp_user"]:
                             request.session.pop(key, None)
 
                         messages.success(request, "✅ Account created successfully! Welcome to VaxSafe!")
@@ -190,10 +203,10 @@ def verify(request):
                 return render(request, "htmlpages/verify.html")
 
         elif action == "resend":
-            email = request.session.get("email")
+            email = (request.session.get("otp_state") or {}).get("email")
             if email:
-                if send_otp(request, email):
-                    messages.success(request, "✅ New OTP sent to your email!")
+                send_otp(request, email)
+                messages.success(request, "✅ A new OTP is on its way to your email.")
                 return render(request, "htmlpages/verify.html")
             else:
                 return redirect("register")
@@ -237,53 +250,53 @@ def logout(request):
 @login_required(login_url='login')
 def dashboard(request):
     """Main dashboard view with statistics"""
-    # Get latest updates
-    updates = Update.objects.all().order_by("-created_at")[:5]
-
-    # Get family members count
-    family_members_count = FamilyMember.objects.filter(user=request.user).count()
+    # Get latest updates (only the columns the dashboard card renders)
+    updates = Update.objects.only('title', 'description', 'created_at').order_by("-created_at")[:5]
 
-    # Get vaccine statistics
     today = timezone.now().date()
 
-    total_vaccines = Vaccine.objects.filter(user=request.user).count()
-
+    # Per-user counts are cached briefly; signals drop the entry on writes
+    cache_key = dashboard_cache_key(request.user.pk)
+    stats = cache.get(cache_key)
+    if stats is None:
+        # All vaccine counts in a single query. Scheduled doses whose date has
+        # passed count as overdue without rewriting their status on a GET.
+        stats = Vaccine.objects.filter(user=request.user).aggregate(
+            total=Count('id'),
+            upcoming=Count('id', filter=Q(status='Scheduled', date_administered__gte=today)),
+            overdue=Count('id', filter=Q(status='Overdue') | Q(status='Scheduled', date_administered__lt=today)),
+        )
+        try:
+            stats['family_members'] = request.user.profile.family_members_count
+        except Profile.DoesNotExist:
+            stats['family_members'] = FamilyMember.objects.filter(user=request.user).count()
+        stats['active_reminders'] = Reminder.objects.filter(
+            user=request.user,
+            completed=False,
+            scheduled_datetime__gte=timezone.now()
+        ).count()
+        cache.set(cache_key, stats, DASHBOARD_CACHE_TIMEOUT)
+
+    # Next three upcoming, with the recipient joined; left lazy so it only
+    # runs if the template renders it
     upcoming_vaccines = Vaccine.objects.filter(
         user=request.user,
         status='Scheduled',
         date_administered__gte=today
-    ).order_by('date_administered')
-
-    upcoming_count = upcoming_vaccines.count()
-
-    # Update overdue vaccines
-    Vaccine.objects.filter(
-        user=request.user,
-        status='Scheduled',
-        date_administered__lt=today
-    ).update(status='Overdue')
-
-    overdue_count = Vaccine.objects.filter(
-        user=request.user,
-        status='Overdue'
-    ).count()
-
-    # Get active reminders count
-    active_reminders_count = Reminder.objects.filter(
-        user=request.user,
-        completed=False,
-        scheduled_datetime__gte=timezone.now()
-    ).count()
+    ).select_related('family_member', 'user').only(
+        'id', 'name', 'dose_number', 'date_administered', 'status',
+        'family_member__name', 'user__username', 'user__first_name', 'user__last_name'
+    ).order_by('date_administered')[:3]
 
     context = {
         'updates': updates,
-        'family_members_count': family_members_count,
-        'total_vaccines': total_vaccines,
-        'upcoming_vaccines': upcoming_vaccines[:3],  # Show top 3
-        'upcoming_count': upcoming_count,
-        'overdue_count': overdue_count,
-        'reminders_active': active_reminders_count > 0,
-        'active_reminders_count': active_reminders_count,
+        'family_members_count': stats['family_members'],
+        'total_vaccines': stats['total'],
+        'upcoming_vaccines': upcoming_vaccines,
+        'upcoming_count': stats['upcoming'],
+        'overdue_count': stats['overdue'],
+        'reminders_active': stats['active_reminders'] > 0,
+        'active_reminders_count': stats['active_reminders'],
     }
 
     return render(request, "htmlpages/dashboard.html", context)
@@ -292,7 +305,14 @@ def dashboard(request):
 @login_required
 def profile_view(request):
     """User profile management view"""
-    profile, created = Profile.objects.get_or_create(user=request.user)
+    try:
+        profile = request.user.profile
+    except Profile.DoesNotExist:
+        # Accounts created before profiles were added automatically
+        profile = Profile.objects.create(
+            user=request.user,
+            family_members_count=FamilyMember.objects.filter(user=request.user).count()
+        )
 
     if request.method == 'POST':
         # Handle photo deletion
@@ -332,13 +352,16 @@ profile = profile_view
 @login_required
 def familymembers(request):
     """View all family members"""
-    members = FamilyMember.objects.filter(user=request.user).annotate(
+    # Evaluate once; the template loops over the rows and shows the count
+    members = list(FamilyMember.objects.filter(user=request.user).only(
+        'id', 'name', 'age', 'vaccine_name', 'date_time', 'notification_type'
+    ).annotate(
         vaccine_count=Count('vaccines')
-    ).order_by('name')
+    ).order_by('name'))
 
     context = {
         'members': members,
-        'total_members': members.count(),
+        'total_members': len(members),
         'title': 'Family Members'
     }
     return render(request, "htmlpages/familymembers.html", context)
@@ -370,7 +393,7 @@ def addfamilymember(request):
 @login_required
 def edit_family_member(request, member_id):
     """Edit a family member"""
-    family_member = get_object_or_404(FamilyMember, id=member_id, user=request.user)
+    family_member = get_object_or_404(FamilyMember.objects.for_user(request.user), id=member_id)
 
     if request.method == 'POST':
         form = FamilyMemberForm(request.POST, instance=family_member)
@@ -395,13 +418,17 @@ def edit_family_member(request, member_id):
 @login_required
 def delete_family_member(request, member_id):
     """Delete a family member"""
-    family_member = get_object_or_404(FamilyMember, id=member_id, user=request.user)
+    # Count the member's vaccines in the same query that loads them
+    family_member = get_object_or_404(
+        FamilyMember.objects.for_user(request.user).annotate(vaccine_count=Count('vaccines')),
+        id=member_id,
+    )
+    vaccine_count = family_member.vaccine_count
 
     if request.method == 'POST':
         name = family_member.name
 
         # Check if family member has vaccines
-        vaccine_count = family_member.vaccines.count()
         if vaccine_count > 0:
             messages.warning(
                 request,
@@ -414,7 +441,7 @@ def delete_family_member(request, member_id):
 
     context = {
         'family_member': family_member,
-        'vaccine_count': family_member.vaccines.count()
+        'vaccine_count': vaccine_count
     }
     return render(request, 'htmlpages/delete_family_member_confirm.html', context)
 
@@ -448,6 +475,24 @@ def add_vaccine(request):
     return render(request, 'htmlpages/addvaccine.html', context)
 
 
+def effective_status(today):
+    """Status as shown to the user: past-due Scheduled doses read as Overdue"""
+    # Computed at read time so pages never write; the mark_overdue_vaccines
+    # command persists the change in the background
+    return Case(
+        When(status='Scheduled', date_administered__lt=today, then=Value('Overdue')),
+        default=F('status'),
+        output_field=CharField(),
+    )
+
+
+def _schedule_page(queryset, count, number):
+    """One page of a schedule section, reusing a count the stats query already has"""
+    paginator = Paginator(queryset, SCHEDULE_PAGE_SIZE)
+    paginator.count = count  # cached_property; setting it skips a COUNT(*)
+    return paginator.get_page(number)
+
+
 @login_required
 def vaccine_schedule(request):
     """Display vaccine schedule with filtering"""
@@ -455,8 +500,14 @@ def vaccine_schedule(request):
     member_filter = request.GET.get('member', '')
     status_filter = request.GET.get('status', '')
 
+    today = timezone.now().date()
+
     # Base queryset
-    vaccines = Vaccine.objects.filter(user=request.user).select_related('family_member')
+    vaccines = Vaccine.objects.filter(user=request.user).select_related(
+        'family_member', 'user'
+    ).only(*_VACCINE_LIST_FIELDS).annotate(
+        effective_status=effective_status(today)
+    )
 
     # Apply filters
     if member_filter:
@@ -466,38 +517,41 @@ def vaccine_schedule(request):
             vaccines = vaccines.filter(family_member_id=member_filter)
 
     if status_filter:
-        vaccines = vaccines.filter(status=status_filter)
-
-    # Update overdue vaccines
-    today = timezone.now().date()
-    Vaccine.objects.filter(
-        user=request.user,
-        status='Scheduled',
-        date_administered__lt=today
-    ).update(status='Overdue')
-
-    # Separate upcoming and past
-    upcoming_vaccines = vaccines.filter(date_administered__gte=today).order_by('date_administered')
-    past_vaccines = vaccines.filter(date_administered__lt=today).order_by('-date_administered')
+        vaccines = vaccines.filter(effective_status=status_filter)
+
+    # Calculate statistics in a single query
+    stats = vaccines.aggregate(
+        total=Count('id'),
+        upcoming=Count('id', filter=Q(date_administered__gte=today)),
+        completed=Count('id', filter=Q(status='Completed')),
+        overdue=Count('id', filter=Q(effective_status='Overdue')),
+    )
+
+    # Separate upcoming and past; each section is paged on its own
+    # (?upage= / ?ppage=) so long histories stay bounded
+    upcoming_vaccines = _schedule_page(
+        vaccines.filter(date_administered__gte=today).order_by('date_administered'),
+        stats['upcoming'],
+        request.GET.get('upage'),
+    )
+    past_vaccines = _schedule_page(
+        vaccines.filter(date_administered__lt=today).order_by('-date_administered'),
+        stats['total'] - stats['upcoming'],
+        request.GET.get('ppage'),
+    )
 
     # Get family members for filter
-    family_members = FamilyMember.objects.filter(user=request.user)
-
-    # Calculate statistics
-    total_count = vaccines.count()
-    upcoming_count = upcoming_vaccines.count()
-    completed_count = vaccines.filter(status='Completed').count()
-    overdue_count = vaccines.filter(status='Overdue').count()
+    family_members = FamilyMember.objects.filter(user=request.user).only('id', 'name')
 
     context = {
         'vaccines': vaccines,
         'upcoming_vaccines': upcoming_vaccines,
         'past_vaccines': past_vaccines,
         'family_members': family_members,
-        'total_count': total_count,
-        'upcoming_count': upcoming_count,
-        'completed_count': completed_count,
-        'overdue_count': overdue_count,
+        'total_count': stats['total'],
+        'upcoming_count': stats['upcoming'],
+        'completed_count': stats['completed'],
+        'overdue_count': stats['overdue'],
         'selected_member': member_filter,
         'selected_status': status_filter,
         'title': 'Vaccine Schedule'
@@ -508,7 +562,7 @@ def vaccine_schedule(request):
 @login_required
 def edit_vaccine(request, vaccine_id):
     """Edit an existing vaccine record"""
-    vaccine = get_object_or_404(Vaccine, id=vaccine_id, user=request.user)
+    vaccine = get_object_or_404(Vaccine.objects.for_user(request.user), id=vaccine_id)
 
     if request.method == 'POST':
         form = VaccineForm(request.POST, instance=vaccine, user=request.user)
@@ -534,7 +588,7 @@ def edit_vaccine(request, vaccine_id):
 @login_required
 def delete_vaccine(request, vaccine_id):
     """Delete a vaccine record"""
-    vaccine = get_object_or_404(Vaccine, id=vaccine_id, user=request.user)
+    vaccine = get_object_or_404(Vaccine.objects.for_user(request.user), id=vaccine_id)
 
     if request.method == 'POST':
         vaccine_name = vaccine.name
@@ -552,13 +606,21 @@ def delete_vaccine(request, vaccine_id):
 @login_required
 def vaccine_detail(request, vaccine_id):
     """View detailed information about a vaccine"""
-    vaccine = get_object_or_404(Vaccine, id=vaccine_id, user=request.user)
+    # Join the recipient so get_recipient_name needs no second query
+    vaccine = get_object_or_404(
+        Vaccine.objects.for_user(request.user).select_related('family_member', 'user'),
+        id=vaccine_id,
+    )
+
+    # Read the date once and evaluate each check once
+    today = timezone.now().date()
+    is_upcoming = vaccine.is_upcoming(today)
 
     context = {
         'vaccine': vaccine,
-        'is_upcoming': vaccine.is_upcoming(),
-        'is_overdue': vaccine.is_overdue(),
-        'days_until': vaccine.days_until() if vaccine.is_upcoming() else None,
+        'is_upcoming': is_upcoming,
+        'is_overdue': vaccine.is_overdue(today),
+        'days_until': vaccine.days_until(today) if is_upcoming else None,
         'title': f'{vaccine.name} Details'
     }
     return render(request, 'htmlpages/vaccine_detail.html', context)
@@ -573,7 +635,7 @@ def upcoming_vaccinations(request):
         user=request.user,
         status='Scheduled',
         date_administered__gte=today
-    ).select_related('family_member').order_by('date_administered')
+    ).select_related('family_member', 'user').only(*_VACCINE_LIST_FIELDS).order_by('date_administered')
 
     context = {
         'vaccinations': upcoming,
@@ -588,17 +650,11 @@ def overdue_vaccinations(request):
     """View overdue vaccinations"""
     today = timezone.now().date()
 
-    # Update status for overdue vaccines
-    Vaccine.objects.filter(
-        user=request.user,
-        status='Scheduled',
-        date_administered__lt=today
-    ).update(status='Overdue')
-
-    overdue = Vaccine.objects.filter(
-        user=request.user,
-        status='Overdue'
-    ).select_related('family_member').order_by('date_administered')
+    overdue = Vaccine.objects.filter(user=request.user).annotate(
+        effective_status=effective_status(today)
+    ).filter(effective_status='Overdue').select_related('family_member', 'user').only(
+        *_VACCINE_LIST_FIELDS
+    ).order_by('date_administered')
 
     context = {
         'vaccinations': overdue,
@@ -615,17 +671,31 @@ def overdue_vaccinations(request):
 @login_required
 def reminder(request):
     """List all reminders"""
-    reminders = Reminder.objects.filter(user=request.user).order_by('-scheduled_datetime')
+    now = timezone.now()
+    # Let the database work out each row's status against a single "now"
+    reminders = Reminder.objects.filter(user=request.user).select_related(
+        'family_member', 'user'
+    ).annotate(
+        db_status=Case(
+            When(completed=True, then=Value('Completed')),
+            When(scheduled_datetime__lt=now, then=Value('Missed')),
+            default=Value('Active'),
+            output_field=CharField(),
+        )
+    ).order_by('-scheduled_datetime')
 
-    # Separate active and past reminders
-    active_reminders = [r for r in reminders if r.is_active]
-    past_reminders = [r for r in reminders if not r.is_active]
+    # Active and past reminders as lazy SQL filters; they only hit the
+    # database if a template actually uses them
+    active_q = Q(completed=False, scheduled_datetime__gte=now)
+    active_reminders = reminders.filter(active_q).order_by('scheduled_datetime')
+    past_reminders = reminders.exclude(active_q)
 
     context = {
         'reminders': reminders,
         'active_reminders': active_reminders,
         'past_reminders': past_reminders,
-        'active_count': len(active_reminders),
+        'active_count': active_reminders.count,
+        'family_members': FamilyMember.objects.filter(user=request.user).only('id', 'name'),
         'title': 'Reminders'
     }
     return render(request, 'htmlpages/reminder.html', context)
@@ -637,12 +707,21 @@ def add_reminder(request):
     if request.method == 'POST':
         vaccine_name = request.POST.get('vaccine_name', '').strip()
         scheduled_datetime = request.POST.get('scheduled', '').strip()
-        family_member = request.POST.get('family_member', '').strip()
+        member_id = request.POST.get('family_member', '').strip()
 
-        if not (vaccine_name and scheduled_datetime and family_member):
+        if not (vaccine_name and scheduled_datetime):
             messages.error(request, "❌ Please fill in all required fields.")
             return redirect('reminder')
 
+        # Blank means the reminder is for the user themself
+        family_member = None
+        if member_id:
+            if member_id.isdigit():
+                family_member = FamilyMember.objects.filter(id=member_id, user=request.user).first()
+            if family_member is None:
+                messages.error(request, "❌ Please choose one of your family members.")
+                return redirect('reminder')
+
         try:
             Reminder.objects.create(
                 user=request.user,
@@ -659,31 +738,59 @@ def add_reminder(request):
     return redirect('reminder')
 
 
+def _parse_datetime_or_none(value):
+    """parse_datetime that also returns None for well-formed but impossible dates"""
+    try:
+        return parse_datetime(value.strip())
+    except ValueError:
+        return None
+
+
 @login_required
 def edit_reminder(request):
     """Edit all reminders (bulk update)"""
     if request.method == 'POST':
-        reminders = Reminder.objects.filter(user=request.user)
-        updated_count = 0
-
+        fields = ['vaccine_name', 'scheduled_datetime', 'family_member', 'completed']
+        reminders = Reminder.objects.filter(user=request.user).only('id', *fields)
+        members = {str(m.id): m for m in FamilyMember.objects.filter(user=request.user).only('id')}
+
+        # Parse every posted date up front; rows whose date won't parse are skipped
+        scheduled = {}
+        for key, value in request.POST.items():
+            if key.startswith('scheduled_'):
+                reminder_id = key[len('scheduled_'):]
+                parsed = _parse_datetime_or_none(value)
+                if parsed is None and value.strip():
+                    logger.warning("Invalid date %r for reminder %s", value, reminder_id)
+                scheduled[reminder_id] = parsed
+
+        # bulk_update bypasses auto_now, so stamp updated_at by hand
+        now = timezone.now()
+        to_update = []
         for r in reminders:
             vaccine_name = request.POST.get(f'vaccine_name_{r.id}')
-            scheduled_datetime = request.POST.get(f'scheduled_{r.id}')
-            family_member = request.POST.get(f'family_member_{r.id}')
+            scheduled_datetime = scheduled.get(str(r.id))
+            member_id = request.POST.get(f'family_member_{r.id}')
             completed = request.POST.get(f'completed_{r.id}') == 'on'
 
-            if vaccine_name and scheduled_datetime and family_member:
-                try:
-                    r.vaccine_name = vaccine_name
-                    r.scheduled_datetime = parse_datetime(scheduled_datetime)
-                    r.family_member = family_member
-                    r.completed = completed
-                    r.save()
-                    updated_count += 1
-                except Exception as e:
-                    print(f"Error updating reminder {r.id}: {e}")
+            # Blank member id means the reminder is for the user themself
+            if not (vaccine_name and scheduled_datetime and (member_id == '' or member_id in members)):
+                continue
+
+            r.vaccine_name = vaccine_name
+            r.scheduled_datetime = scheduled_datetime
+            r.family_member = members.get(member_id)
+            r.completed = completed
+            r.updated_at = now
+            to_update.append(r)
+
+        # One multi-row UPDATE instead of a save() per reminder
+        Reminder.objects.bulk_update(to_update, [*fields, 'updated_at'], batch_size=500)
+        updated_count = len(to_update)
 
         if updated_count > 0:
+            # bulk_update skips post_save, so drop the cached counts here
+            cache.delete(dashboard_cache_key(request.user.id))
             messages.success(request, f"✅ {updated_count} reminder(s) updated successfully!")
         else:
             messages.warning(request, "⚠️ No reminders were updated.")
@@ -705,7 +812,7 @@ def centers(request):
     search_query = request.GET.get('search', '')
 
     # Base queryset - only active centers
-    centers_list = VaccinationCenter.objects.filter(is_active=True)
+    centers_list = VaccinationCenter.objects.filter(is_active=True).prefetch_related('vaccines')
 
     # Apply city filter
     if city_filter:
@@ -716,21 +823,18 @@ def centers(request):
         centers_list = centers_list.filter(
             Q(name__icontains=search_query) |
             Q(address__icontains=search_query) |
-            Q(available_vaccines__icontains=search_query)
-        )
+            Q(vaccines__name__icontains=search_query)
+        ).distinct()
 
     # Order by city and name
     centers_list = centers_list.order_by('city', 'name')
 
-    # Get all cities for filter dropdown
-    cities = VaccinationCenter.CITY_CHOICES
-
     context = {
         'centers': centers_list,
-        'cities': cities,
+        'cities': _CITY_CHOICES,
         'selected_city': city_filter,
         'search_query': search_query,
-        'total_centers': centers_list.count(),
+        'total_centers': centers_list.count,  # Only queried if a template renders it
         'title': 'Vaccination Centers'
     }
     return render(request, "htmlpages/centers.html", context)
@@ -739,13 +843,21 @@ def centers(request):
 @login_required(login_url='login')
 def center_detail(request, center_id):
     """View detailed information about a vaccination center"""
-    center = get_object_or_404(VaccinationCenter, id=center_id, is_active=True)
+    # Cache the per-center data, not the page: the page carries the user's nav
+    key = center_cache_key(center_id)
+    data = cache.get(key)
+    if data is None:
+        center = get_object_or_404(VaccinationCenter, id=center_id, is_active=True)
+        data = {
+            'center': center,
+            'vaccines_list': center.get_vaccines_list(),
+            'operating_hours': center.get_operating_hours(),
+        }
+        cache.set(key, data, CENTER_CACHE_TIMEOUT)
 
     context = {
-        'center': center,
-        'vaccines_list': center.get_vaccines_list(),
-        'operating_hours': center.get_operating_hours(),
-        'title': center.name
+        **data,
+        'title': data['center'].name
     }
     return render(request, 'htmlpages/center_detail.html', context)
 
@@ -761,8 +873,9 @@ def news_list(request):
     category_filter = request.GET.get('category', '')
     search_query = request.GET.get('search', '')
 
-    # Base queryset - only published news
-    news_items = News.objects.filter(is_published=True)
+    # Base queryset - only published news; cards show the summary, so leave
+    # the full article body in the database
+    news_items = News.objects.filter(is_published=True).defer('content')
 
     # Apply category filter
     if category_filter:
@@ -776,22 +889,24 @@ def news_list(request):
             Q(content__icontains=search_query)
         )
 
-    # Order by publication date
-    news_items = news_items.order_by('-published_date')
+    # Order by publication date and send one page at a time (?page=), so the
+    # response stays bounded however many articles are published
+    news_items = Paginator(news_items.order_by('-published_date'), NEWS_PAGE_SIZE).get_page(
+        request.GET.get('page')
+    )
 
     # Get featured news
-    featured_news = News.objects.filter(is_published=True, is_featured=True).order_by('-published_date')[:3]
-
-    # Get categories for filter
-    categories = News.CATEGORY_CHOICES
+    featured_news = News.objects.filter(
+        is_published=True, is_featured=True
+    ).defer('content').order_by('-published_date')[:3]
 
     context = {
         'news_items': news_items,
         'featured_news': featured_news,
-        'categories': categories,
+        'categories': _NEWS_CATEGORIES,
         'selected_category': category_filter,
         'search_query': search_query,
-        'total_news': news_items.count(),
+        'total_news': news_items.paginator.count,
         'title': 'Health News & Updates'
     }
     return render(request, 'htmlpages/news.html', context)
@@ -805,11 +920,13 @@ def news_detail(request, slug):
     # Increment view count
     news_item.increment_views()
 
-    # Get related news (same category, excluding current)
+    # Get related news (same category, excluding current); only the columns the sidebar shows
     related_news = News.objects.filter(
         category=news_item.category,
         is_published=True
-    ).exclude(id=news_item.id).order_by('-published_date')[:3]
+    ).exclude(id=news_item.id).only(
+        'title', 'slug', 'category', 'image', 'published_date'
+    ).order_by('-published_date')[:3]
 
     context = {
         'news': news_item,
@@ -81,6 +81,34 @@ DATABASES = {
     }
 }
 
+# Signals clear cached entries in whichever process saves the change, so
+# every worker must share one in-memory cache. Set REDIS_URL (needs the
+# redis package) to enable caching; without it nothing is cached, which is
+# slower but never stale.
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
+    }
+
+
+# Fetch request.user together with its profile (see vaxsafe/backends.py).
+# New logins authenticate through the first entry; ModelBackend stays so
+# sessions created before it was added keep resolving.
+AUTHENTICATION_BACKENDS = [
+    'vaxsafe.backends.ProfileModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators